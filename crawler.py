@@ -10,74 +10,236 @@ crawler.py - 3대 뉴스 사이트 통합 크롤러
     └── HankyungCrawler  한국경제
 
   MultiSiteCrawler      세 크롤러를 묶어 한 번에 실행
+
+모든 수집은 하나의 asyncio 이벤트 루프에서 사이트/페이지 단위로 동시에 진행됩니다.
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 
 from __future__ import annotations
 
-import time
+import re
+import json
 import random
+import shutil
+import asyncio
+import tempfile
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, fields
 from datetime import datetime
+from itertools import chain
 from urllib.parse import quote_plus
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import httpx
+import orjson
+import xxhash
+from selectolax.lexbor import LexborHTMLParser
+from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  데이터 클래스
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     title:      str
     press:      str
     pub_time:   str
     url:        str
     source:     str
-    crawled_at: str = field(
-        default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    )
+    crawled_at: str     # 같은 crawl() 호출의 항목은 같은 수집 시각을 공유
 
-    def to_dict(self) -> dict:
-        return {
-            "title":      self.title,
-            "press":      self.press,
-            "pub_time":   self.pub_time,
-            "url":        self.url,
-            "source":     self.source,
-            "crawled_at": self.crawled_at,
-        }
+
+NEWS_COLUMNS = tuple(f.name for f in fields(NewsItem))
+
+
+def _deduplicate(items) -> list:
+    """
+    URL 기준 → URL 없으면 제목 기준으로 중복을 제거합니다. (먼저 나온 항목 유지)
+    긴 URL 문자열 대신 XXH64 해시(int)만 보관해 조회·메모리 비용을 줄입니다.
+    (1만 건 기준 충돌 확률 ~1e-11)
+    """
+    seen: set[int] = set()
+    unique = []
+    for item in items:
+        key = xxhash.xxh64_intdigest(
+            ((item.url or "").strip() or item.title.strip()).encode("utf-8"))
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(item)
+    return unique
+
+
+async def _gather_or_cancel(tasks: list) -> list:
+    """
+    asyncio.gather와 같지만, 하나가 실패하면 나머지 작업을 취소하고 끝날 때까지 기다린 뒤
+    예외를 다시 던집니다. (호출 측이 클라이언트/브라우저를 닫은 뒤에 작업이 남지 않도록)
+    """
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-#  공통 드라이버 팩토리
+#  공통 클라이언트 팩토리 (httpx / Playwright)
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-def build_driver(headless: bool = True) -> webdriver.Chrome:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/124.0.0.0 Safari/537.36"
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+              "AppleWebKit/537.36 (KHTML, like Gecko) "
+              "Chrome/124.0.0.0 Safari/537.36")
+
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# 파싱에 쓰지 않는 리소스(이미지/폰트/CSS/미디어)와 광고·추적 요청은 받지 않음
+_BLOCKED_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+_BLOCKED_HOSTS = ("doubleclick", "google-analytics", "googletagmanager", "/ads/")
+
+
+async def _block_route(route):
+    request = route.request
+    if (request.resource_type in _BLOCKED_TYPES
+            or any(h in request.url for h in _BLOCKED_HOSTS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def new_http_client() -> httpx.AsyncClient:
+    """사이트 간에 공유할 HTTP 클라이언트 (HTTP/2, keep-alive 커넥션 풀)."""
+    # transport를 직접 넘기면 클라이언트의 http2/limits 인자는 무시되므로 여기서 지정
+    # retries는 연결 단계 실패(ConnectError/ConnectTimeout)만 재시도
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
     )
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option("useAutomationExtension", False)
-    driver = webdriver.Chrome(options=options)
-    driver.execute_script(
+    return httpx.AsyncClient(
+        transport=transport,
+        headers={"User-Agent": USER_AGENT},
+        timeout=10,
+        follow_redirects=True,
+    )
+
+
+async def build_context(playwright, user_data_dir: str, headless: bool = True):
+    """전용 Chromium을 영속(persistent) 컨텍스트로 띄우고 공통 설정을 적용합니다."""
+    context = await playwright.chromium.launch_persistent_context(
+        user_data_dir,
+        headless=headless,
+        args=CHROMIUM_ARGS,
+        user_agent=USER_AGENT,
+        viewport={"width": 1920, "height": 1080},
+        accept_downloads=False,
+    )
+    await context.route("**/*", _block_route)
+    await context.add_init_script(
         "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
     )
-    return driver
+    return context
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  공유 브라우저 풀
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class BrowserPool:
+    """
+    Chromium 영속 컨텍스트 하나를 여러 크롤러가 탭(page) 단위로 공유합니다.
+
+    동작:
+      1. 처음 new_page()가 호출될 때 Playwright + Chromium을 띄움
+      2. new_page() → 같은 컨텍스트에서 새 탭 반환 (리소스 차단 적용됨)
+      3. 크롤러는 탭만 닫고, 브라우저는 close()에서 한 번만 종료
+
+    JS 렌더링 폴백이 한 번도 필요 없으면 브라우저는 뜨지 않습니다.
+    """
+
+    def __init__(self, headless: bool = True):
+        self.headless     = headless
+        self._pw          = None
+        self._context     = None
+        self._profile_dir = None
+        self._lock        = None
+        self._closed      = False
+
+    async def new_page(self):
+        """공유 컨텍스트에서 새 탭을 엽니다. 필요하면 브라우저를 띄웁니다."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            # close() 뒤에 남은 작업이 Playwright를 다시 띄우면 아무도 종료하지 않음
+            if self._closed:
+                raise RuntimeError("이미 닫힌 BrowserPool입니다")
+            if self._context is None:
+                await self._launch()
+        return await self._context.new_page()
+
+    async def _launch(self):
+        """Playwright + Chromium을 띄웁니다. 실패하면 시작한 드라이버와 프로필을 정리합니다."""
+        self._pw = await async_playwright().start()
+        self._profile_dir = tempfile.mkdtemp(prefix="news_crawler_")
+        try:
+            self._context = await build_context(self._pw, self._profile_dir,
+                                                self.headless)
+        except BaseException:
+            await self._release()
+            raise
+
+    async def _release(self):
+        """Playwright 드라이버를 멈추고 임시 프로필을 지웁니다."""
+        try:
+            if self._pw:
+                await self._pw.stop()
+        finally:
+            if self._profile_dir:
+                shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._pw = self._context = self._profile_dir = None
+
+    async def close(self):
+        """브라우저와 임시 프로필을 정리합니다. 닫은 뒤에는 new_page()를 쓸 수 없습니다."""
+        self._closed = True
+        try:
+            if self._context:
+                await self._context.close()
+        finally:
+            await self._release()
+
+
+# 브라우저 안에서 한 번의 page.evaluate로 카드 목록을 추출할 때 쓰는 JS 헬퍼
+#   cardsOf(sels)         → 후보 셀렉터 중 처음으로 결과가 있는 카드 목록
+#   pick(root, sels, get) → 후보 셀렉터 중 처음으로 값이 있는 필드
+_JS_HELPERS = """
+      const text = el => (el.innerText || "").trim();
+      const href = el => el.href || el.getAttribute("href") || "";
+      const pick = (root, sels, get) => {
+        for (const sel of sels) {
+          const el = root.querySelector(sel);
+          const value = el ? get(el) : "";
+          if (value) return value;
+        }
+        return "";
+      };
+      const cardsOf = sels => {
+        for (const sel of sels) {
+          const found = document.querySelectorAll(sel);
+          if (found.length) return Array.from(found);
+        }
+        return [];
+      };"""
+
+
+def _js_array(selectors: tuple) -> str:
+    """셀렉터 튜플을 JS 배열 리터럴로 변환합니다."""
+    return json.dumps(list(selectors), ensure_ascii=False)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -89,94 +251,253 @@ class BaseCrawler(ABC):
 
     ┌──────────────────────────────────────────────────────┐
     │  구현 의무 메서드 (추상)                              │
-    │  ├── build_url(keyword, page)  → 검색 URL 생성       │
-    │  ├── wait_selector()           → 로딩 대기 CSS 셀렉터│
-    │  └── parse_page(driver)        → 항목 파싱 로직      │
+    │  ├── build_url(enc_kw, page)   → 검색 URL 생성       │
+    │  ├── parse_page(html, ts)      → HTML → 행 추출      │
+    │  └── parse_rows(rows, ts)      → 행 → NewsItem       │
+    │                                                      │
+    │  클래스 상수 (사이트별 지정)                          │
+    │  ├── WAIT_SELECTOR             → 로딩 대기 CSS 셀렉터│
+    │  │   (wait_selector()를 재정의하면 그 값을 사용)     │
+    │  ├── _SEL_*                    → 목록/필드 셀렉터    │
+    │  └── _JS                       → 브라우저용 행 추출  │
     │                                                      │
     │  공통 제공 메서드 (재사용)                            │
+    │  ├── fetch_html(url)           → 정적 HTML 요청      │
     │  └── crawl(keyword, pages)     → 전체 크롤링 실행    │
     └──────────────────────────────────────────────────────┘
+
+    수집 경로:
+      1차  httpx(HTTP/2, keep-alive)로 HTML 요청 → selectolax 파싱
+      2차  목록이 비어 있으면(JS 렌더링 페이지) Playwright로 렌더링 후
+           _JS 한 번의 page.evaluate로 모든 카드를 행으로 받아 parse_rows()
+
+    페이지 병렬화:
+      crawl()은 코루틴이며 페이지들을 asyncio.gather로 동시에 수집합니다.
+      동시에 진행되는 페이지 수는 max_workers로 제한합니다.
+      요청/렌더링에 실패한 페이지는 그 페이지만 건너뛰고 나머지 결과는 유지합니다.
     """
 
-    SITE_NAME: str = ""
-    SITE_KEY:  str = ""
+    SITE_NAME:     str = ""
+    SITE_KEY:      str = ""
+    WAIT_SELECTOR: str = ""    # 페이지 로딩 완료를 판단할 CSS 셀렉터
+    _JS:           str = ""    # 브라우저에서 카드 행 목록을 반환하는 JS 함수식
+
+    # 렌더링 재시도 / 대기 시간 자동 조정
+    RENDER_RETRIES = 3     # 탐색 타임아웃 시 같은 탭으로 시도할 횟수
+    TIMEOUT_STEP   = 3     # 이만큼 타임아웃이 쌓일 때마다 wait_sec += 2
+    MAX_WAIT_SEC   = 20
+
+    # 셀렉터는 클래스 상수로 한 번만 정의하고 정적 파싱과 _JS가 함께 사용합니다.
+    # 매 호출마다 셀렉터 문자열/리스트를 새로 만들지 않습니다.
 
     def __init__(self, headless: bool = True, wait_sec: int = 8,
-                 delay_range: tuple = (1.2, 2.5)):
-        self.headless    = headless
-        self.wait_sec    = wait_sec
-        self.delay_range = delay_range
-        self._driver = None
+                 delay_range: tuple = (1.2, 2.5),
+                 browser_pool: BrowserPool | None = None,
+                 max_workers: int = 4):
+        self.headless     = headless
+        self.wait_sec     = wait_sec
+        self.delay_range  = delay_range
+        self.browser_pool = browser_pool
+        self.max_workers  = max_workers
+        self._http = None
+        self._base_wait_sec    = wait_sec   # crawl()마다 wait_sec을 이 값으로 되돌림
+        self._session_timeouts = 0          # 누적 렌더링 타임아웃 (wait_sec 자동 조정용)
 
     # ── 추상 메서드 ────────────────────────────────────────────────
     @abstractmethod
-    def build_url(self, keyword: str, page: int) -> str:
-        """키워드 + 페이지 번호로 검색 URL을 생성합니다."""
+    def build_url(self, encoded_keyword: str, page: int) -> str:
+        """URL 인코딩된 키워드 + 페이지 번호로 검색 URL을 생성합니다."""
 
-    @abstractmethod
     def wait_selector(self) -> str:
         """페이지 로딩 완료를 판단할 CSS 셀렉터를 반환합니다."""
+        return self.WAIT_SELECTOR
+
+    @abstractmethod
+    def parse_page(self, html: str, crawled_at: str) -> list:
+        """검색 결과 HTML에서 행(dict)을 뽑아 parse_rows()로 넘깁니다."""
 
     @abstractmethod
-    def parse_page(self, driver: webdriver.Chrome) -> list:
-        """현재 페이지에서 NewsItem 리스트를 파싱하여 반환합니다."""
+    def parse_rows(self, rows: list, crawled_at: str) -> list:
+        """카드별 행(dict) 목록을 NewsItem 리스트(수집 시각 crawled_at)로 변환합니다."""
 
     # ── 공통 실행 엔진 ─────────────────────────────────────────────
-    def crawl(self, keyword: str, pages: int = 5) -> list:
-        """지정 키워드로 pages 수만큼 뉴스를 수집합니다."""
+    async def crawl(self, keyword: str, pages: int = 5,
+                    http: httpx.AsyncClient | None = None,
+                    encoded_keyword: str | None = None) -> list:
+        """
+        지정 키워드로 pages 수만큼 뉴스를 동시에 수집합니다.
+
+        Args:
+            http:            공유할 HTTP 클라이언트 (None이면 이 호출 동안만 새로 생성)
+            encoded_keyword: 미리 quote_plus한 키워드 (None이면 여기서 한 번 인코딩)
+        """
+        enc = encoded_keyword or quote_plus(keyword)
+        ts  = datetime.now().strftime("%Y-%m-%d %H:%M:%S")   # 항목마다 만들지 않음
+        # 대기 시간 자동 조정은 crawl() 한 번 안에서만 유지 (이전 키워드의 타임아웃을 끌고 오지 않음)
+        self.wait_sec = self._base_wait_sec
+        self._session_timeouts = 0
+        own_http = http is None
+        own_pool = self.browser_pool is None
+        self._http = http or new_http_client()
+        if own_pool:
+            self.browser_pool = BrowserPool(self.headless)
+        limit = asyncio.Semaphore(max(1, self.max_workers))
         results = []
-        self._driver = build_driver(self.headless)
-        wait = WebDriverWait(self._driver, self.wait_sec)
+        tasks = [asyncio.ensure_future(self._fetch_page(limit, enc, page, pages, ts))
+                 for page in range(1, pages + 1)]
 
         try:
-            for page in range(1, pages + 1):
-                url = self.build_url(keyword, page)
-                print(f"      [{self.SITE_NAME}] {page}/{pages}p → {url}")
-                self._driver.get(url)
-
-                try:
-                    wait.until(EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, self.wait_selector())
-                    ))
-                except TimeoutException:
-                    print(f"      ⚠️  타임아웃 - {page}p 건너뜀")
-                    continue
-
-                try:
-                    items = self.parse_page(self._driver)
-                except Exception as e:
-                    print(f"      ⚠️  파싱 오류: {e}")
-                    items = []
-
-                results.extend(items)
-                print(f"      ✓ {len(items)}건 수집 (누적 {len(results)}건)")
-                time.sleep(random.uniform(*self.delay_range))
+            # gather는 입력 순서대로 결과를 돌려주므로 페이지 순서가 유지됨
+            per_page = await _gather_or_cancel(tasks)
+            # 사이트 안에서 먼저 중복을 걷어 내 통합 단계로 넘기는 양을 줄임
+            results = _deduplicate(chain.from_iterable(per_page))
+            print(f"      ✓ [{self.SITE_NAME}] 누적 {len(results)}건")
 
         except Exception as e:
             print(f"      ❌ [{self.SITE_NAME}] 크롤링 중단: {e}")
         finally:
-            if self._driver:
-                self._driver.quit()
-                self._driver = None
+            if own_http:
+                await self._http.aclose()
+            if own_pool:
+                await self.browser_pool.close()
+                self.browser_pool = None
+            self._http = None
 
         return results
 
+    async def _fetch_page(self, limit: asyncio.Semaphore, encoded_keyword: str,
+                          page: int, pages: int, crawled_at: str) -> list:
+        """페이지 하나를 수집합니다."""
+        async with limit:
+            url = self.build_url(encoded_keyword, page)
+            print(f"      [{self.SITE_NAME}] {page}/{pages}p → {url}")
+
+            try:
+                items = self.parse_page(await self.fetch_html(url), crawled_at)
+            except httpx.HTTPError as e:
+                print(f"      ⚠️  요청 실패: {e}")
+                items = []
+            except Exception as e:
+                print(f"      ⚠️  파싱 오류: {e}")
+                items = []
+
+            # 정적 HTML에 목록이 없으면 JS 렌더링 페이지로 보고 브라우저 사용
+            if not items:
+                print(f"      ↻ 정적 HTML 목록 없음 → 브라우저 렌더링 ({page}p)")
+                try:
+                    items = await self._render_page(url, crawled_at)
+                except Exception as e:
+                    # 브라우저 실행/탐색 실패는 이 페이지만 건너뛰고 다른 페이지 결과는 유지
+                    print(f"      ⚠️  브라우저 렌더링 실패 - {page}p 건너뜀: {e}")
+                    return []
+                if items is None:
+                    print(f"      ⚠️  타임아웃 - {page}p 건너뜀")
+                    return []
+
+            print(f"      ✓ {page}p {len(items)}건 수집")
+            await asyncio.sleep(random.uniform(*self.delay_range))
+            return items
+
+    async def fetch_html(self, url: str) -> str:
+        """공유 HTTP 클라이언트로 페이지 HTML을 가져옵니다."""
+        resp = await self._http.get(url)
+        resp.raise_for_status()
+        return resp.text
+
+    async def _render_page(self, url: str, crawled_at: str):
+        """
+        Playwright로 페이지를 렌더링한 뒤 파싱합니다. (폴백 경로)
+        카드별 요소 조회 대신 _JS 한 번으로 전체 카드를 추출합니다.
+        탐색이 타임아웃이면 같은 탭(연결 유지)에서 지수 백오프로 재시도합니다.
+        문서는 로드됐는데 목록이 나타나지 않으면 재시도해도 같으므로 바로 포기합니다.
+
+        Returns:
+            NewsItem 리스트, 탐색 재시도가 모두 타임아웃이거나 목록이 없으면 None
+        """
+        page = await self.browser_pool.new_page()
+        try:
+            for attempt in range(self.RENDER_RETRIES):
+                try:
+                    # 문서 파싱이 끝날 때(DOMContentLoaded)까지만 기다리고 load는 기다리지 않음
+                    # (응답 커밋 직후에는 목록 컨테이너만 붙어 있고 카드가 아직 없을 수 있음)
+                    await page.goto(url, wait_until="domcontentloaded",
+                                    timeout=self.wait_sec * 1000)
+                    break
+                except PlaywrightTimeoutError:
+                    self._note_timeout()
+                    if attempt + 1 < self.RENDER_RETRIES:
+                        await asyncio.sleep(0.3 * 2 ** attempt)
+            else:
+                return None
+
+            try:
+                await page.wait_for_selector(self.wait_selector(), state="attached",
+                                             timeout=self.wait_sec * 1000)
+            except PlaywrightTimeoutError:
+                self._note_timeout()
+                return None
+
+            try:
+                # 결과를 브라우저에서 JSON 문자열 하나로 직렬화해 받아 orjson으로 파싱
+                raw = await page.evaluate(f"() => JSON.stringify(({self._JS})())")
+                return self.parse_rows(orjson.loads(raw or "[]"), crawled_at)
+            except Exception as e:
+                print(f"      ⚠️  파싱 오류: {e}")
+                return []
+        finally:
+            await page.close()
+
+    def _note_timeout(self):
+        """타임아웃이 TIMEOUT_STEP회 쌓일 때마다 wait_sec을 2초씩 늘립니다. (최대 MAX_WAIT_SEC)"""
+        self._session_timeouts += 1
+        if self._session_timeouts % self.TIMEOUT_STEP == 0 and self.wait_sec < self.MAX_WAIT_SEC:
+            self.wait_sec = min(self.wait_sec + 2, self.MAX_WAIT_SEC)
+            print(f"      ⏱  [{self.SITE_NAME}] 타임아웃 누적 {self._session_timeouts}회 "
+                  f"→ 대기 {self.wait_sec}초로 조정")
+
     # ── 공통 헬퍼 ─────────────────────────────────────────────────
     @staticmethod
-    def safe_text(element, selector: str, default: str = "") -> str:
+    def safe_text(node, selector: str, default: str = "") -> str:
         """CSS 셀렉터로 텍스트를 안전하게 추출합니다."""
-        try:
-            return element.find_element(By.CSS_SELECTOR, selector).text.strip()
-        except NoSuchElementException:
+        found = node.css_first(selector)
+        if found is None:
             return default
+        return found.text().strip() or default
 
     @staticmethod
-    def safe_attr(element, selector: str, attr: str, default: str = "") -> str:
+    def safe_attr(node, selector: str, attr: str, default: str = "") -> str:
         """CSS 셀렉터로 속성값을 안전하게 추출합니다."""
-        try:
-            return element.find_element(By.CSS_SELECTOR, selector).get_attribute(attr) or default
-        except NoSuchElementException:
+        found = node.css_first(selector)
+        if found is None:
             return default
+        return found.attributes.get(attr) or default
+
+    @classmethod
+    def first_text(cls, node, selectors: tuple) -> str:
+        """후보 셀렉터를 순서대로 시도해 처음 나온 텍스트를 반환합니다."""
+        for sel in selectors:
+            text = cls.safe_text(node, sel)
+            if text:
+                return text
+        return ""
+
+    @classmethod
+    def first_attr(cls, node, selectors: tuple, attr: str) -> str:
+        """후보 셀렉터를 순서대로 시도해 처음 나온 속성값을 반환합니다."""
+        for sel in selectors:
+            value = cls.safe_attr(node, sel, attr)
+            if value:
+                return value
+        return ""
+
+    @staticmethod
+    def first_cards(tree, selectors: tuple) -> list:
+        """후보 목록 셀렉터 중 처음으로 결과가 있는 카드 목록을 반환합니다."""
+        for sel in selectors:
+            cards = tree.css(sel)
+            if cards:
+                return cards
+        return []
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -202,35 +523,55 @@ class NaverCrawler(BaseCrawler):
     _BASE = ("https://search.naver.com/search.naver"
              "?where=news&query={kw}&start={start}&sort=1")
 
-    def build_url(self, keyword: str, page: int) -> str:
+    WAIT_SELECTOR = "ul.list_news > li"
+    _SEL_CARDS = ("ul.list_news > li.bx",)
+    _SEL_TITLE = ("a.news_tit",)
+    _SEL_PRESS = ("a.info.press", "a.press")
+    _SEL_SPANS = "span.info"
+
+    _JS = """() => {""" + _JS_HELPERS + f"""
+      return cardsOf({_js_array(_SEL_CARDS)}).map(card => ({{
+        title: pick(card, {_js_array(_SEL_TITLE)}, text),
+        href:  pick(card, {_js_array(_SEL_TITLE)}, href),
+        press: pick(card, {_js_array(_SEL_PRESS)}, text),
+        spans: Array.from(card.querySelectorAll("{_SEL_SPANS}")).map(text),
+      }}));
+    }}"""
+
+    def build_url(self, encoded_keyword: str, page: int) -> str:
         start = (page - 1) * 10 + 1
-        return self._BASE.format(kw=quote_plus(keyword), start=start)
-
-    def wait_selector(self) -> str:
-        return "ul.list_news > li"
-
-    def parse_page(self, driver) -> list:
+        return self._BASE.format(kw=encoded_keyword, start=start)
+
+    def parse_page(self, html: str, crawled_at: str) -> list:
+        rows = []
+        for card in self.first_cards(LexborHTMLParser(html), self._SEL_CARDS):
+            rows.append({
+                "title": self.first_text(card, self._SEL_TITLE),
+                "href":  self.first_attr(card, self._SEL_TITLE, "href"),
+                "press": self.first_text(card, self._SEL_PRESS),
+                "spans": [span.text().strip() for span in card.css(self._SEL_SPANS)],
+            })
+        return self.parse_rows(rows, crawled_at)
+
+    def parse_rows(self, rows: list, crawled_at: str) -> list:
         items = []
-        cards = driver.find_elements(By.CSS_SELECTOR, "ul.list_news > li.bx")
-        for card in cards:
-            title = self.safe_text(card, "a.news_tit")
+        for row in rows:
+            title = row.get("title")
             if not title:
                 continue
-            press    = self.safe_text(card, "a.info.press") or self.safe_text(card, "a.press")
-            pub_time = self._extract_time(card)
-            url      = self.safe_attr(card, "a.news_tit", "href")
-            items.append(NewsItem(title=title, press=press or "알 수 없음",
-                                  pub_time=pub_time, url=url, source=self.SITE_KEY))
+            items.append(NewsItem(title=title, press=row.get("press") or "알 수 없음",
+                                  pub_time=self._extract_time(row.get("spans") or []),
+                                  url=row.get("href") or "", source=self.SITE_KEY,
+                                  crawled_at=crawled_at))
         return items
 
-    @staticmethod
-    def _extract_time(card) -> str:
-        spans = card.find_elements(By.CSS_SELECTOR, "span.info")
-        for span in spans:
-            text = span.text.strip()
-            if any(k in text for k in ["전", ".", "시간", "일"]):
-                return text
-        return spans[-1].text.strip() if spans else ""
+    # "3시간 전" / "1일 전" / "2024.05.01." 형태의 시간 표기 판별
+    _TIME_RE = re.compile(r"전|시간|일|\.")
+
+    @classmethod
+    def _extract_time(cls, spans: list) -> str:
+        return next((t for t in spans if cls._TIME_RE.search(t)),
+                    spans[-1] if spans else "")
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -256,39 +597,46 @@ class DaumCrawler(BaseCrawler):
     _BASE = ("https://search.daum.net/search"
              "?w=news&q={kw}&p={page}&spacing=0&sort=recency")
 
-    def build_url(self, keyword: str, page: int) -> str:
-        return self._BASE.format(kw=quote_plus(keyword), page=page)
-
-    def wait_selector(self) -> str:
-        return "div#newsSearchMainList, ul.list_news, div.wrap_g"
-
-    def parse_page(self, driver) -> list:
+    WAIT_SELECTOR = "div#newsSearchMainList, ul.list_news, div.wrap_g"
+    _SEL_CARDS = ("li.g_item", "div.cont_inner", "li[data-docid]")
+    _SEL_TITLE = ("a.tit_main", "a.link_txt", "a.item-title", "a.tit_g")
+    _SEL_HREF  = ("a.tit_main", "a.link_txt", "a.item-title")
+    _SEL_PRESS = ("span.name_cp", "span.txt_cp", "span.info_txt")
+    _SEL_TIME  = ("span.num_date", "span.date_txt", "span.info_date")
+
+    _JS = """() => {""" + _JS_HELPERS + f"""
+      return cardsOf({_js_array(_SEL_CARDS)}).map(card => ({{
+        title: pick(card, {_js_array(_SEL_TITLE)}, text),
+        href:  pick(card, {_js_array(_SEL_HREF)}, href),
+        press: pick(card, {_js_array(_SEL_PRESS)}, text),
+        time:  pick(card, {_js_array(_SEL_TIME)}, text),
+      }}));
+    }}"""
+
+    def build_url(self, encoded_keyword: str, page: int) -> str:
+        return self._BASE.format(kw=encoded_keyword, page=page)
+
+    def parse_page(self, html: str, crawled_at: str) -> list:
+        rows = []
+        for card in self.first_cards(LexborHTMLParser(html), self._SEL_CARDS):
+            rows.append({
+                "title": self.first_text(card, self._SEL_TITLE),
+                "href":  self.first_attr(card, self._SEL_HREF, "href"),
+                "press": self.first_text(card, self._SEL_PRESS),
+                "time":  self.first_text(card, self._SEL_TIME),
+            })
+        return self.parse_rows(rows, crawled_at)
+
+    def parse_rows(self, rows: list, crawled_at: str) -> list:
         items = []
-        cards = []
-        for sel in ["li.g_item", "div.cont_inner", "li[data-docid]"]:
-            cards = driver.find_elements(By.CSS_SELECTOR, sel)
-            if cards:
-                break
-
-        for card in cards:
-            title = (self.safe_text(card, "a.tit_main")
-                     or self.safe_text(card, "a.link_txt")
-                     or self.safe_text(card, "a.item-title")
-                     or self.safe_text(card, "a.tit_g"))
+        for row in rows:
+            title = row.get("title")
             if not title:
                 continue
-
-            url = (self.safe_attr(card, "a.tit_main", "href")
-                   or self.safe_attr(card, "a.link_txt", "href")
-                   or self.safe_attr(card, "a.item-title", "href"))
-            press = (self.safe_text(card, "span.name_cp")
-                     or self.safe_text(card, "span.txt_cp")
-                     or self.safe_text(card, "span.info_txt"))
-            pub_time = (self.safe_text(card, "span.num_date")
-                        or self.safe_text(card, "span.date_txt")
-                        or self.safe_text(card, "span.info_date"))
-            items.append(NewsItem(title=title, press=press or "알 수 없음",
-                                  pub_time=pub_time, url=url, source=self.SITE_KEY))
+            items.append(NewsItem(title=title, press=row.get("press") or "알 수 없음",
+                                  pub_time=row.get("time") or "",
+                                  url=row.get("href") or "", source=self.SITE_KEY,
+                                  crawled_at=crawled_at))
         return items
 
 
@@ -318,41 +666,52 @@ class HankyungCrawler(BaseCrawler):
     _BASE = ("https://www.hankyung.com/search"
              "?search_str={kw}&page={page}&type=news&sort=date")
 
-    def build_url(self, keyword: str, page: int) -> str:
-        return self._BASE.format(kw=quote_plus(keyword), page=page)
-
-    def wait_selector(self) -> str:
-        return "ul.list-news, div.news-list, article.news-item"
-
-    def parse_page(self, driver) -> list:
+    WAIT_SELECTOR = "ul.list-news, div.news-list, article.news-item"
+    _SEL_CARDS = ("li.item", "li.news-item", "article.list-item")
+    _SEL_TITLE = (".news-tit", "h3.title a", "a.tit", ".tit")
+    _SEL_HREF  = (".news-tit", "h3.title a", "a.tit")
+    _SEL_PRESS = ("span.author", "span.reporter")
+    _SEL_TIME  = ("span.date", "time")
+    _SEL_DATETIME = ("time",)          # 텍스트가 없으면 datetime 속성 사용
+
+    _JS = """() => {""" + _JS_HELPERS + f"""
+      return cardsOf({_js_array(_SEL_CARDS)}).map(card => ({{
+        title: pick(card, {_js_array(_SEL_TITLE)}, text),
+        href:  pick(card, {_js_array(_SEL_HREF)}, href),
+        press: pick(card, {_js_array(_SEL_PRESS)}, text),
+        time:  pick(card, {_js_array(_SEL_TIME)}, text)
+               || pick(card, {_js_array(_SEL_DATETIME)}, el => el.getAttribute("datetime") || ""),
+      }}));
+    }}"""
+
+    def build_url(self, encoded_keyword: str, page: int) -> str:
+        return self._BASE.format(kw=encoded_keyword, page=page)
+
+    def parse_page(self, html: str, crawled_at: str) -> list:
+        rows = []
+        for card in self.first_cards(LexborHTMLParser(html), self._SEL_CARDS):
+            rows.append({
+                "title": self.first_text(card, self._SEL_TITLE),
+                "href":  self.first_attr(card, self._SEL_HREF, "href"),
+                "press": self.first_text(card, self._SEL_PRESS),
+                "time":  (self.first_text(card, self._SEL_TIME)
+                          or self.first_attr(card, self._SEL_DATETIME, "datetime")),
+            })
+        return self.parse_rows(rows, crawled_at)
+
+    def parse_rows(self, rows: list, crawled_at: str) -> list:
         items = []
-        cards = []
-        for sel in ["li.item", "li.news-item", "article.list-item"]:
-            cards = driver.find_elements(By.CSS_SELECTOR, sel)
-            if cards:
-                break
-
-        for card in cards:
-            title = (self.safe_text(card, ".news-tit")
-                     or self.safe_text(card, "h3.title a")
-                     or self.safe_text(card, "a.tit")
-                     or self.safe_text(card, ".tit"))
+        for row in rows:
+            title = row.get("title")
             if not title:
                 continue
-
-            url = (self.safe_attr(card, ".news-tit", "href")
-                   or self.safe_attr(card, "h3.title a", "href")
-                   or self.safe_attr(card, "a.tit", "href"))
-            if url and url.startswith("/"):
+            url = row.get("href") or ""
+            if url.startswith("/"):
                 url = "https://www.hankyung.com" + url
-
-            press    = self.safe_text(card, "span.author") or self.safe_text(card, "span.reporter") or "한국경제"
-            pub_time = (self.safe_text(card, "span.date")
-                        or self.safe_text(card, "time")
-                        or self.safe_attr(card, "time", "datetime"))
-
-            items.append(NewsItem(title=title, press=press,
-                                  pub_time=pub_time, url=url, source=self.SITE_KEY))
+            items.append(NewsItem(title=title, press=row.get("press") or "한국경제",
+                                  pub_time=row.get("time") or "",
+                                  url=url, source=self.SITE_KEY,
+                                  crawled_at=crawled_at))
         return items
 
 
@@ -365,14 +724,30 @@ class MultiSiteCrawler:
 
     사용 예시:
         crawler = MultiSiteCrawler(sites=["naver", "daum", "hankyung"])
-        results = crawler.crawl(keyword="삼성전자", pages_per_site=3)
+        results = crawler.crawl_sync(keyword="삼성전자", pages_per_site=3)
         df = crawler.to_dataframe(results)
 
+        # 이미 이벤트 루프 안이라면
+        results = await crawler.crawl(keyword="삼성전자", pages_per_site=3)
+
     레지스트리 구조:
         _REGISTRY 딕셔너리에만 추가하면 새 사이트를 바로 지원합니다.
 
     중복 제거:
         URL 기준 → URL 없으면 제목 기준으로 중복 제거합니다.
+
+    브라우저 공유:
+        JS 렌더링 폴백이 필요한 크롤러는 BrowserPool 하나를 함께 쓰며,
+        사이트마다 Chrome을 새로 띄우지 않고 탭만 엽니다.
+
+    병렬 실행:
+        모든 사이트의 crawl() 코루틴을 한 이벤트 루프에서 asyncio.gather로
+        동시에 실행합니다. 대기 시간이 대부분이라 스레드/프로세스가 필요 없습니다.
+
+    커넥션 재사용:
+        HTTP 클라이언트는 매니저가 들고 있다가 같은 이벤트 루프에서 crawl()을
+        다시 부르면(키워드 여러 개 등) 열려 있는 커넥션을 그대로 씁니다.
+        다 쓰면 aclose()로 닫습니다. crawl_sync()는 끝날 때 자동으로 닫습니다.
     """
 
     # ✏️ 새 사이트 추가 시 여기에만 등록
@@ -387,46 +762,106 @@ class MultiSiteCrawler:
         invalid = set(target_keys) - set(self._REGISTRY)
         if invalid:
             raise ValueError(f"지원하지 않는 사이트: {invalid} | 사용 가능: {list(self._REGISTRY)}")
+        self.headless = headless
+        self._http      = None
+        self._http_loop = None
         self.crawlers = [
             self._REGISTRY[k](headless=headless, wait_sec=wait_sec)
             for k in target_keys
         ]
 
-    def crawl(self, keyword: str, pages_per_site: int = 3) -> list:
-        """등록된 모든 사이트에서 순차적으로 뉴스를 수집합니다."""
-        all_items = []
+    async def crawl(self, keyword: str, pages_per_site: int = 3) -> list:
+        """등록된 모든 사이트에서 동시에 뉴스를 수집합니다."""
         print(f"\n  🌐 멀티사이트 크롤링 시작")
         print(f"  키워드: [{keyword}] | 사이트당 {pages_per_site}페이지")
         print(f"  대상: {[c.SITE_NAME for c in self.crawlers]}")
 
+        enc  = quote_plus(keyword)     # 사이트·페이지마다 다시 인코딩하지 않음
+        pool = BrowserPool(self.headless)
         for crawler in self.crawlers:
-            print(f"\n  ─── {crawler.SITE_NAME} ───")
-            items = crawler.crawl(keyword=keyword, pages=pages_per_site)
-            all_items.extend(items)
+            crawler.browser_pool = pool
+
+        http = await self._client()
+        try:
+            per_site = await asyncio.gather(*[
+                c.crawl(keyword=keyword, pages=pages_per_site, http=http,
+                        encoded_keyword=enc)
+                for c in self.crawlers
+            ])
+        finally:
+            await pool.close()
+            for crawler in self.crawlers:
+                crawler.browser_pool = None
+
+        for crawler, items in zip(self.crawlers, per_site):
             print(f"  ✅ {crawler.SITE_NAME}: {len(items)}건")
 
-        all_items = self._deduplicate(all_items)
+        # gather 결과는 등록 순서 그대로 → 중복 제거 기준이 고정됨
+        all_items = _deduplicate(chain.from_iterable(per_site))
         print(f"\n  📦 총 수집: {len(all_items)}건 (중복 제거 후)")
         return all_items
 
+    def crawl_sync(self, keyword: str, pages_per_site: int = 3) -> list:
+        """이벤트 루프 밖(스크립트 등)에서 crawl()을 실행하는 동기 래퍼."""
+        async def run():
+            try:
+                return await self.crawl(keyword=keyword, pages_per_site=pages_per_site)
+            finally:
+                await self.aclose()
+        return asyncio.run(run())
+
+    async def aclose(self):
+        """공유 HTTP 클라이언트의 커넥션을 닫습니다."""
+        if self._http is not None:
+            await self._http.aclose()
+        self._http = self._http_loop = None
+
+    async def _client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프에 묶인 공유 HTTP 클라이언트를 반환합니다."""
+        loop = asyncio.get_running_loop()
+        if self._http is not None and self._http_loop is not loop:
+            # 다른 루프에서 만든 커넥션은 재사용할 수 없으므로 닫고 새로 만듦
+            # (이전 루프가 이미 끝났으면 소켓 정리가 실패할 수 있어 오류는 무시하고 버림)
+            old, self._http = self._http, None
+            try:
+                await old.aclose()
+            except Exception:
+                pass
+        if self._http is None or self._http.is_closed:
+            self._http = new_http_client()
+            self._http_loop = loop
+        return self._http
+
     def to_dataframe(self, items: list):
+        """항목 리스트를 컬럼 단위로 바로 DataFrame으로 만듭니다. (dict 리스트 생략)"""
         import pandas as pd
-        return pd.DataFrame([i.to_dict() for i in items])
+        return pd.DataFrame({c: [getattr(i, c) for i in items] for c in NEWS_COLUMNS})
+
+    def to_parquet(self, items: list, path: str, batch_size: int = 1024) -> str:
+        """
+        항목 리스트를 batch_size씩 나눠 Parquet 파일로 스트리밍 저장합니다.
+        전체 DataFrame을 만들지 않으므로 최대 메모리는 배치 크기에 비례합니다.
+
+        Returns:
+            저장된 파일 경로
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema([(c, pa.string()) for c in NEWS_COLUMNS])
+        with pq.ParquetWriter(path, schema) as writer:
+            for start in range(0, len(items), batch_size):
+                chunk = items[start:start + batch_size]
+                writer.write_batch(pa.RecordBatch.from_pydict(
+                    {c: [getattr(i, c) for i in chunk] for c in NEWS_COLUMNS},
+                    schema=schema,
+                ))
+        return path
 
     def crawl_to_df(self, keyword: str, pages_per_site: int = 3):
         """crawl() + to_dataframe() 편의 메서드."""
-        return self.to_dataframe(self.crawl(keyword=keyword, pages_per_site=pages_per_site))
+        return self.to_dataframe(self.crawl_sync(keyword=keyword, pages_per_site=pages_per_site))
 
-    @staticmethod
-    def _deduplicate(items: list) -> list:
-        seen = set()
-        unique = []
-        for item in items:
-            key = item.url.strip() if item.url.strip() else item.title.strip()
-            if key not in seen:
-                seen.add(key)
-                unique.append(item)
-        return unique
 
     @classmethod
     def list_sites(cls) -> list:
@@ -1,11 +1,10 @@
 """
 demo.py - 샘플 데이터로 전체 파이프라인 테스트
-Selenium/Chrome 없이도 3대 사이트 통합 구조의 결과물을 확인할 수 있습니다.
+브라우저/네트워크 없이도 3대 사이트 통합 구조의 결과물을 확인할 수 있습니다.
 """
 
+import numpy as np
 import pandas as pd
-import random
-from datetime import datetime, timedelta
 from sentiment import SentimentAnalyzer
 from visualizer import DashboardVisualizer
 from exporter import DataExporter
@@ -50,24 +49,32 @@ PRESS_BY_SOURCE = {
 
 
 def generate_sample_data(keyword: str, n_per_site: int = 10) -> pd.DataFrame:
-    random.seed(42)
-    rows = []
-    base = datetime.now()
-
-    for source in SOURCES:
-        for i in range(n_per_site):
-            title = random.choice(SAMPLE_TITLES)
-            if keyword not in title and random.random() > 0.4:
-                title = title.replace("삼성전자", keyword)
-            rows.append({
-                "title":      title,
-                "press":      random.choice(PRESS_BY_SOURCE[source]),
-                "pub_time":   (base - timedelta(hours=random.randint(1, 48))).strftime("%Y.%m.%d %H:%M"),
-                "url":        f"https://{source}.example.com/article/{i+1000}",
-                "source":     source,
-                "crawled_at": base.strftime("%Y-%m-%d %H:%M:%S"),
-            })
-    return pd.DataFrame(rows)
+    rng = np.random.default_rng(42)
+    n = n_per_site * len(SOURCES)
+    base = pd.Timestamp.now()
+
+    # 제목: 샘플에서 뽑은 뒤 키워드가 없으면 60% 확률로 '삼성전자'를 키워드로 치환
+    titles = rng.choice(np.array(SAMPLE_TITLES), size=n)
+    swap = (np.char.find(titles, keyword) == -1) & (rng.random(n) > 0.4)
+    if swap.any():    # np.char.replace는 빈 배열에서 ValueError
+        titles = np.where(swap, np.char.replace(titles, "삼성전자", keyword), titles)
+
+    sources = np.repeat(SOURCES, n_per_site)
+    press = np.concatenate([rng.choice(PRESS_BY_SOURCE[s], size=n_per_site)
+                            for s in SOURCES])
+    hours = rng.integers(1, 49, size=n)          # 1~48시간 전
+    article_no = np.tile(np.arange(1000, 1000 + n_per_site), len(SOURCES))
+
+    return pd.DataFrame({
+        "title":      titles,
+        "press":      press,
+        "pub_time":   (base - pd.to_timedelta(hours, unit="h")).strftime("%Y.%m.%d %H:%M"),
+        "url":        np.char.add(np.char.add(np.char.add("https://", sources),
+                                              ".example.com/article/"),
+                                  article_no.astype(str)),
+        "source":     sources,
+        "crawled_at": base.strftime("%Y-%m-%d %H:%M:%S"),
+    })
 
 
 def run_demo(keyword: str = "삼성전자"):
@@ -94,25 +101,25 @@ def run_demo(keyword: str = "삼성전자"):
 
     # 사이트별 감성 분포
     print("\n  📊 사이트별 감성 분포:")
+    # 사이트마다 boolean 필터를 두 번씩 거는 대신 groupby 한 번으로 집계
     site_labels = {"naver": "네이버", "daum": "다음", "hankyung": "한국경제"}
-    for src in SOURCES:
-        sub = df[df["source"] == src]["sentiment"].value_counts()
-        pos = sub.get("긍정", 0)
-        neg = sub.get("부정", 0)
-        neu = sub.get("중립", 0)
-        avg = df[df["source"] == src]["score"].mean()
-        print(f"     {site_labels[src]:6s} | 긍정:{pos} 부정:{neg} 중립:{neu} | 평균:{avg:+.2f}")
+    g      = df.groupby("source")
+    counts = (g["sentiment"].value_counts().unstack(fill_value=0)
+              .reindex(index=SOURCES, columns=["긍정", "부정", "중립"], fill_value=0))
+    avgs   = g["score"].mean().reindex(SOURCES)
+    for src, (pos, neg, neu) in counts.iterrows():
+        print(f"     {site_labels[src]:6s} | 긍정:{pos} 부정:{neg} 중립:{neu} | 평균:{avgs[src]:+.2f}")
 
     # STEP 3
     print("\n[STEP 3] 📊 대시보드 생성")
     viz = DashboardVisualizer(keyword=keyword)
-    img = viz.create_dashboard(df)
+    img = viz.create_dashboard(df, stats)
     print(f"  ✅ {img}")
 
     # STEP 4
     print("\n[STEP 4] 📂 엑셀 저장")
     exp = DataExporter(keyword=keyword)
-    xlsx = exp.export(df)
+    xlsx = exp.export(df, stats)
     print(f"  ✅ {xlsx}")
 
     print("\n" + "=" * 60)
@@ -1,39 +1,68 @@
 """
 exporter.py - 분석 결과를 Excel 파일로 내보내기
-openpyxl 기반 스타일링 + 요약 시트 포함
+xlsxwriter 기반 단일 패스 스트리밍 쓰기(스타일 포함) + 요약 시트 포함
 """
 
 import os
 from datetime import datetime
 import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.styles import (
-    PatternFill, Font, Alignment, Border, Side, GradientFill
-)
-from openpyxl.utils import get_column_letter
-from openpyxl.chart import BarChart, PieChart, Reference
-from openpyxl.chart.label import DataLabelList
+import xlsxwriter
+from xlsxwriter.utility import xl_col_to_name
+
+from sentiment import SentimentAnalyzer
 
 
 # ── 색상 상수 ─────────────────────────────────────────────────────────────────
 COLOR = {
-    "header_bg":  "1A1A2E",
-    "header_fg":  "EAEAEA",
-    "pos_fill":   "C8F7C5",   # 연두
-    "neg_fill":   "FADBD8",   # 연빨강
-    "neu_fill":   "F2F3F4",   # 연회색
-    "pos_dark":   "1E8449",
-    "neg_dark":   "C0392B",
-    "neu_dark":   "7F8C8D",
-    "row_alt":    "EBF5FB",   # 짝수행 배경
+    "header_bg":  "#1A1A2E",
+    "header_fg":  "#EAEAEA",
+    "pos_fill":   "#C8F7C5",   # 연두
+    "neg_fill":   "#FADBD8",   # 연빨강
+    "neu_fill":   "#F2F3F4",   # 연회색
+    "pos_dark":   "#1E8449",
+    "neg_dark":   "#C0392B",
+    "neu_dark":   "#7F8C8D",
+    "row_alt":    "#EBF5FB",   # 짝수행 배경
+}
+
+THIN_BORDER = {"border": 1, "border_color": "#CCCCCC"}
+
+# ── 서식 속성 ─────────────────────────────────────────────────────────────────
+# xlsxwriter Format은 워크북에 묶이므로 속성만 모듈 상수로 두고,
+# 실제 Format 객체는 DataExporter._build_formats()가 워크북마다 한 번씩 만듭니다.
+FMT_HEADER = {
+    "bold": True, "font_color": COLOR["header_fg"], "font_size": 11,
+    "bg_color": COLOR["header_bg"], "align": "center", "valign": "vcenter",
+    **THIN_BORDER,
+}
+FMT_CELL = {"valign": "vcenter", **THIN_BORDER}
+
+# 데이터 행 색상은 셀마다 칠하지 않고 조건부 서식 규칙으로 지정 (앞쪽 규칙이 우선)
+#   행 배경: 긍정/부정 행은 전체 강조색, 그 외는 짝수행 줄무늬
+#   감성 셀: 값에 따라 글꼴 강조 (배경 규칙과 겹치지 않아 함께 적용됨)
+ROW_FILLS = {
+    "긍정": {"bg_color": COLOR["pos_fill"]},
+    "부정": {"bg_color": COLOR["neg_fill"]},
+    "alt":  {"bg_color": COLOR["row_alt"]},
+}
+SENTIMENT_FONTS = {
+    "긍정": {"bold": True, "font_color": COLOR["pos_dark"]},
+    "부정": {"bold": True, "font_color": COLOR["neg_dark"]},
+    "중립": {"font_color": COLOR["neu_dark"]},
 }
 
-THIN_BORDER = Border(
-    left=Side(style="thin", color="CCCCCC"),
-    right=Side(style="thin", color="CCCCCC"),
-    top=Side(style="thin", color="CCCCCC"),
-    bottom=Side(style="thin", color="CCCCCC"),
-)
+FMT_TITLE = {"font_size": 16, "bold": True, "font_color": COLOR["header_bg"],
+             "align": "center", "valign": "vcenter"}
+FMT_DATE  = {"font_size": 10, "font_color": "#888888", "align": "center"}
+FMT_TABLE_HEADER = {"bold": True, "font_color": "#FFFFFF", "bg_color": COLOR["header_bg"],
+                    "align": "center", **THIN_BORDER}
+
+# KPI 카드 (라벨 / 값) - 배경색만 카드마다 다름
+KPI_BG    = [COLOR["header_bg"], COLOR["pos_dark"], COLOR["neg_dark"],
+             COLOR["neu_dark"], "#2C3E50"]
+FMT_KPI   = {"bold": True, "font_color": "#FFFFFF", "align": "center", **THIN_BORDER}
+FMT_KPI_LABEL = {**FMT_KPI, "font_size": 10}
+FMT_KPI_VALUE = {**FMT_KPI, "font_size": 18, "valign": "vcenter"}
 
 
 class DataExporter:
@@ -59,15 +88,26 @@ class DataExporter:
         "crawled_at":  "수집 시각",
     }
 
+    COL_WIDTHS = {
+        "제목": 55, "언론사": 16, "게시 시간": 16,
+        "감성 점수": 10, "감성": 8,
+        "긍정 키워드": 20, "부정 키워드": 20,
+        "원문 링크": 50, "수집 시각": 18,
+    }
+
     def __init__(self, keyword: str, output_dir: str = "output"):
         self.keyword = keyword
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
 
-    def export(self, df: pd.DataFrame) -> str:
+    def export(self, df: pd.DataFrame, stats: dict = None) -> str:
         """
         DataFrame을 엑셀 파일로 저장합니다.
-        
+        스타일은 쓰는 시점에 함께 지정하므로 파일을 다시 열어 고치지 않습니다.
+
+        Args:
+            stats: SentimentAnalyzer.get_statistics() 결과 (None이면 여기서 집계)
+
         Returns:
             저장된 파일 경로
         """
@@ -75,198 +115,188 @@ class DataExporter:
         filename = f"{self.keyword}_감성분석_{timestamp}.xlsx"
         path = os.path.join(self.output_dir, filename)
 
-        # 컬럼 순서 정렬 & 한글 컬럼명 적용
-        export_cols = [c for c in self.COLUMNS if c in df.columns]
-        export_df = df[export_cols].rename(columns=self.COLUMNS)
-
-        with pd.ExcelWriter(path, engine="openpyxl") as writer:
-            # 시트 1: 전체 데이터
-            export_df.to_excel(writer, sheet_name="전체 데이터", index=False)
-
-            # 시트 2: 긍정 기사
-            pos_df = export_df[export_df["감성"] == "긍정"]
-            pos_df.to_excel(writer, sheet_name="긍정 기사", index=False)
-
-            # 시트 3: 부정 기사
-            neg_df = export_df[export_df["감성"] == "부정"]
-            neg_df.to_excel(writer, sheet_name="부정 기사", index=False)
-
-        # openpyxl로 다시 열어 스타일 적용
-        wb = load_workbook(path)
-        self._style_data_sheet(wb["전체 데이터"], df)
-        self._style_data_sheet(wb["긍정 기사"],  df[df["sentiment"] == "긍정"])
-        self._style_data_sheet(wb["부정 기사"],  df[df["sentiment"] == "부정"])
-        self._create_summary_sheet(wb, df)
-
-        # 시트 순서 재정렬 (요약이 맨 앞)
-        wb.move_sheet("요약 통계", offset=-wb.sheetnames.index("요약 통계"))
-        wb.save(path)
+        # constant_memory: 행 단위로 바로 디스크에 내보내 전체 셀을 메모리에 들고 있지 않음
+        #                  (행 순서대로만 쓸 수 있으므로 각 시트는 위에서 아래로 씀)
+        # strings_to_urls:  URL 문자열은 하이퍼링크로 바꾸지 않고 일반 텍스트로 저장
+        # nan_inf_to_errors: 빈 결과의 평균 점수 같은 NaN은 예외 대신 #NUM! 셀로 저장
+        with xlsxwriter.Workbook(path, {"constant_memory": True,
+                                        "strings_to_urls": False,
+                                        "nan_inf_to_errors": True}) as wb:
+            fmt = self._build_formats(wb)
+
+            # 시트 순서: 요약 → 전체 → 긍정 → 부정 (추가한 순서대로 저장됨)
+            self._create_summary_sheet(wb, stats or SentimentAnalyzer.get_statistics(df), fmt)
+            self._write_data_sheets(wb, df, fmt)
         return path
 
-    # ── 데이터 시트 스타일링 ──────────────────────────────────────
-    def _style_data_sheet(self, ws, df: pd.DataFrame):
-        """헤더 스타일 + 행 색상 + 감성 셀 강조 + 컬럼 너비 자동 조정"""
-        col_widths = {
-            "제목": 55, "언론사": 16, "게시 시간": 16,
-            "감성 점수": 10, "감성": 8,
-            "긍정 키워드": 20, "부정 키워드": 20,
-            "원문 링크": 50, "수집 시각": 18,
+    # ── 서식 ──────────────────────────────────────────────────────
+    @staticmethod
+    def _build_formats(wb) -> dict:
+        """워크북 하나에서 공유할 서식을 모듈 상수 속성으로 한 번만 생성합니다."""
+        fmt = {
+            "header":       wb.add_format(FMT_HEADER),
+            "title":        wb.add_format(FMT_TITLE),
+            "date":         wb.add_format(FMT_DATE),
+            "table_header": wb.add_format(FMT_TABLE_HEADER),
+            "kpi": [(wb.add_format({**FMT_KPI_LABEL, "bg_color": bg}),
+                     wb.add_format({**FMT_KPI_VALUE, "bg_color": bg})) for bg in KPI_BG],
         }
+        # 데이터 셀은 (일반, 줄바꿈) 두 가지뿐이고 색상은 조건부 서식이 담당
+        fmt["cell"] = wb.add_format(FMT_CELL)
+        fmt["wrap"] = wb.add_format({**FMT_CELL, "text_wrap": True})
+        fmt["row_fill"]       = {k: wb.add_format(v) for k, v in ROW_FILLS.items()}
+        fmt["sentiment_font"] = {k: wb.add_format(v) for k, v in SENTIMENT_FONTS.items()}
+        return fmt
+
+    # ── 데이터 시트 쓰기 ──────────────────────────────────────────
+    def _write_data_sheets(self, wb, df: pd.DataFrame, fmt: dict):
+        """
+        전체/긍정/부정 데이터 시트를 DataFrame 한 번 순회로 함께 씁니다.
+        필터링한 DataFrame 사본 없이 각 행을 감성 값에 맞는 시트로 보냅니다.
+        (constant_memory는 시트별 행 순서만 지키면 되므로 시트를 번갈아 써도 됨)
+        """
+        # 컬럼 순서 정렬 & 한글 컬럼명은 헤더로만 적용
+        export_cols = [c for c in self.COLUMNS if c in df.columns]
+        headers = [self.COLUMNS[c] for c in export_cols]
 
-        # ① 헤더 스타일
-        for cell in ws[1]:
-            cell.fill = PatternFill("solid", fgColor=COLOR["header_bg"])
-            cell.font = Font(bold=True, color=COLOR["header_fg"], size=11)
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-            cell.border = THIN_BORDER
-            # 컬럼 너비
-            col_letter = get_column_letter(cell.column)
-            col_name = cell.value or ""
-            width = col_widths.get(col_name, 15)
-            ws.column_dimensions[col_letter].width = width
-
-        ws.row_dimensions[1].height = 22
-
-        # 감성 컬럼 인덱스 찾기
-        sentiment_col = None
-        for cell in ws[1]:
-            if cell.value == "감성":
-                sentiment_col = cell.column
-                break
-
-        # ② 데이터 행 스타일
-        for row_idx, row in enumerate(ws.iter_rows(min_row=2), start=2):
-            # 짝수행 배경
-            row_fill = PatternFill("solid", fgColor=COLOR["row_alt"]) \
-                       if row_idx % 2 == 0 else None
-
-            sentiment_val = None
-            if sentiment_col:
-                sentiment_val = ws.cell(row_idx, sentiment_col).value
-
-            for cell in row:
-                # 기본 스타일
-                cell.alignment = Alignment(
-                    vertical="center", wrap_text=(cell.column == 2)
-                )
-                cell.border = THIN_BORDER
-                if row_fill:
-                    cell.fill = row_fill
-
-                # 감성 셀 강조색 (감성 컬럼 전체 행)
-                if sentiment_val == "긍정":
-                    cell.fill = PatternFill("solid", fgColor=COLOR["pos_fill"])
-                    if cell.column == sentiment_col:
-                        cell.font = Font(bold=True, color=COLOR["pos_dark"])
-                elif sentiment_val == "부정":
-                    cell.fill = PatternFill("solid", fgColor=COLOR["neg_fill"])
-                    if cell.column == sentiment_col:
-                        cell.font = Font(bold=True, color=COLOR["neg_dark"])
-                elif sentiment_val == "중립":
-                    if cell.column == sentiment_col:
-                        cell.font = Font(color=COLOR["neu_dark"])
-
-        # ③ 틀 고정 (헤더 행)
-        ws.freeze_panes = "A2"
-        # ④ 자동 필터
-        ws.auto_filter.ref = ws.dimensions
+        ws_all = self._add_data_sheet(wb, "전체 데이터", headers, fmt)
+        ws_by_sentiment = {
+            "긍정": self._add_data_sheet(wb, "긍정 기사", headers, fmt),
+            "부정": self._add_data_sheet(wb, "부정 기사", headers, fmt),
+        }
+        next_row = {"전체": 1, "긍정": 1, "부정": 1}
+
+        # 재정렬/fillna한 DataFrame 사본 대신 컬럼별 파이썬 리스트를 묶어 행으로 순회
+        # (결측값이 있는 컬럼만 빈 문자열로 채움)
+        columns = [(df[c].fillna("") if df[c].hasnans else df[c]).tolist()
+                   for c in export_cols]
+
+        # 감성 값은 시트 선택에만 쓰고, 행 서식은 모두 같으므로 컬럼별 서식을 한 번만 정함
+        # (2번째 컬럼만 줄바꿈)
+        sent_col = export_cols.index("sentiment")
+        col_formats = [fmt["wrap"] if c == 1 else fmt["cell"] for c in range(len(export_cols))]
+        for values in zip(*columns):
+            r = next_row["전체"]
+            self._write_data_row(ws_all, r, values, col_formats)
+            next_row["전체"] = r + 1
+
+            sentiment = values[sent_col]
+            ws = ws_by_sentiment.get(sentiment)
+            if ws is not None:
+                r = next_row[sentiment]
+                self._write_data_row(ws, r, values, col_formats)
+                next_row[sentiment] = r + 1
+
+        # 자동 필터 + 조건부 서식 (데이터 끝 행은 다 쓴 뒤에 알 수 있음)
+        last_col = max(len(headers) - 1, 0)
+        for key, ws in [("전체", ws_all), *ws_by_sentiment.items()]:
+            ws.autofilter(0, 0, next_row[key] - 1, last_col)
+            self._add_sentiment_rules(ws, next_row[key] - 1, last_col, sent_col, fmt)
+
+    def _add_data_sheet(self, wb, name: str, headers: list, fmt: dict):
+        """헤더 스타일 + 컬럼 너비 + 틀 고정을 적용한 빈 데이터 시트를 추가합니다."""
+        ws = wb.add_worksheet(name)
+        ws.write_row(0, 0, headers, fmt["header"])
+        ws.set_row(0, 22)
+        for c, header in enumerate(headers):
+            ws.set_column(c, c, self.COL_WIDTHS.get(header, 15))
+        ws.freeze_panes(1, 0)
+        return ws
+
+    @staticmethod
+    def _write_data_row(ws, r: int, values: tuple, col_formats: list):
+        """데이터 한 행을 미리 정한 컬럼별 서식으로 셀마다 한 번씩만 씁니다."""
+        for c, (value, cell_fmt) in enumerate(zip(values, col_formats)):
+            ws.write(r, c, value, cell_fmt)
+
+    @staticmethod
+    def _add_sentiment_rules(ws, last_row: int, last_col: int, sent_col: int, fmt: dict):
+        """감성 값 기준 행 배경 / 짝수행 줄무늬 / 감성 셀 글꼴을 조건부 서식으로 지정합니다."""
+        if last_row < 1:
+            return
+        ref = f"${xl_col_to_name(sent_col)}2"   # 범위 첫 행 기준 상대 참조 ($열 고정)
+        fills = fmt["row_fill"]
+        for sentiment in ("긍정", "부정"):
+            ws.conditional_format(1, 0, last_row, last_col, {
+                "type": "formula", "criteria": f'={ref}="{sentiment}"',
+                "format": fills[sentiment],
+            })
+        # 엑셀 기준 짝수행 배경 (긍정/부정 규칙이 우선이므로 나머지 행에만 보임)
+        ws.conditional_format(1, 0, last_row, last_col, {
+            "type": "formula", "criteria": "=MOD(ROW(),2)=0", "format": fills["alt"],
+        })
+        for sentiment, font in fmt["sentiment_font"].items():
+            ws.conditional_format(1, sent_col, last_row, sent_col, {
+                "type": "cell", "criteria": "==", "value": f'"{sentiment}"', "format": font,
+            })
 
     # ── 요약 시트 생성 ────────────────────────────────────────────
-    def _create_summary_sheet(self, wb, df: pd.DataFrame):
+    def _create_summary_sheet(self, wb, stats: dict, fmt: dict):
         """KPI 카드 + 차트가 포함된 요약 시트를 생성합니다."""
-        ws = wb.create_sheet("요약 통계")
-        ws.sheet_view.showGridLines = False
+        ws = wb.add_worksheet("요약 통계")
+        ws.hide_gridlines(2)
 
-        total = len(df)
-        counts = df["sentiment"].value_counts()
-        pos_n = counts.get("긍정", 0)
-        neg_n = counts.get("부정", 0)
-        neu_n = counts.get("중립", 0)
-        avg_score = round(df["score"].mean(), 3)
+        total = stats["total"]
+        pos_n = stats["positive"]
+        neg_n = stats["negative"]
+        neu_n = stats["neutral"]
+        avg_score = stats["avg_score"]
 
         # ─ 타이틀 ─
-        ws.merge_cells("B2:H2")
-        title_cell = ws["B2"]
-        title_cell.value = f"📰 [{self.keyword}] 뉴스 감성 분석 요약 리포트"
-        title_cell.font = Font(size=16, bold=True, color=COLOR["header_bg"])
-        title_cell.alignment = Alignment(horizontal="center", vertical="center")
-        ws.row_dimensions[2].height = 30
-
-        ws.merge_cells("B3:H3")
-        date_cell = ws["B3"]
-        date_cell.value = f"분석 일시: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M')}"
-        date_cell.font = Font(size=10, color="888888")
-        date_cell.alignment = Alignment(horizontal="center")
-
-        # ─ KPI 카드 ─
+        ws.merge_range("B2:H2", f"📰 [{self.keyword}] 뉴스 감성 분석 요약 리포트",
+                       fmt["title"])
+        ws.set_row(1, 30)
+
+        ws.merge_range("B3:H3", f"분석 일시: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M')}",
+                       fmt["date"])
+
+        # ─ KPI 카드 (색상은 KPI_BG 순서) ─
         kpis = [
-            ("총 기사 수",  total,      COLOR["header_bg"], "FFFFFF"),
-            ("긍정 기사",   pos_n,      COLOR["pos_dark"],  "FFFFFF"),
-            ("부정 기사",   neg_n,      COLOR["neg_dark"],  "FFFFFF"),
-            ("중립 기사",   neu_n,      "7F8C8D",           "FFFFFF"),
-            ("평균 점수",   avg_score,  "2C3E50",           "FFFFFF"),
+            ("총 기사 수",  total),
+            ("긍정 기사",   pos_n),
+            ("부정 기사",   neg_n),
+            ("중립 기사",   neu_n),
+            ("평균 점수",   avg_score),
         ]
 
-        for i, (label, value, bg, fg) in enumerate(kpis):
-            col = chr(ord("B") + i)
-            label_cell = ws[f"{col}5"]
-            value_cell = ws[f"{col}6"]
-
-            label_cell.value = label
-            label_cell.fill = PatternFill("solid", fgColor=bg)
-            label_cell.font = Font(bold=True, color=fg, size=10)
-            label_cell.alignment = Alignment(horizontal="center")
-            label_cell.border = THIN_BORDER
-
-            value_cell.value = value
-            value_cell.fill = PatternFill("solid", fgColor=bg)
-            value_cell.font = Font(bold=True, color=fg, size=18)
-            value_cell.alignment = Alignment(horizontal="center", vertical="center")
-            value_cell.border = THIN_BORDER
-            ws.row_dimensions[6].height = 36
-            ws.column_dimensions[col].width = 14
-
-        # ─ 차트용 데이터 테이블 ─
-        ws["B9"] = "감성"
-        ws["C9"] = "건수"
-        ws["D9"] = "비율(%)"
-        for i, (label, n) in enumerate(
-            [("긍정", pos_n), ("중립", neu_n), ("부정", neg_n)], start=10
-        ):
-            ws[f"B{i}"] = label
-            ws[f"C{i}"] = n
-            ws[f"D{i}"] = round(n / total * 100, 1) if total else 0
-
-        # 테이블 헤더 스타일
-        for cell in [ws["B9"], ws["C9"], ws["D9"]]:
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill("solid", fgColor=COLOR["header_bg"])
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = THIN_BORDER
+        ws.set_row(5, 36)
+        ws.set_column(1, len(kpis), 14)
+        # 스트리밍 모드는 행 순서대로 써야 하므로 라벨 행(5) → 값 행(6) 순으로 씀
+        for i, ((label, _), (label_fmt, _)) in enumerate(zip(kpis, fmt["kpi"]), start=1):
+            ws.write(4, i, label, label_fmt)
+        for i, ((_, value), (_, value_fmt)) in enumerate(zip(kpis, fmt["kpi"]), start=1):
+            ws.write(5, i, value, value_fmt)
+
+        # ─ 차트용 데이터 테이블 (B9:D12) ─
+        ws.write_row(8, 1, ["감성", "건수", "비율(%)"], fmt["table_header"])
+        rows = [
+            ["긍정", pos_n, stats["pos_ratio"]],
+            ["중립", neu_n, stats["neu_ratio"]],
+            ["부정", neg_n, stats["neg_ratio"]],
+        ]
+        for i, row in enumerate(rows, start=9):
+            ws.write_row(i, 1, row)
+
+        series = {
+            "name":       ["요약 통계", 8, 2],
+            "categories": ["요약 통계", 9, 1, 11, 1],
+            "values":     ["요약 통계", 9, 2, 11, 2],
+        }
+        # openpyxl 차트 14cm × 10cm와 같은 크기 (픽셀)
+        size = {"width": 529, "height": 378}
 
         # ─ 막대 차트 ─
-        bar_chart = BarChart()
-        bar_chart.type = "col"
-        bar_chart.title = "감성별 기사 수"
-        bar_chart.y_axis.title = "건수"
-        bar_chart.x_axis.title = "감성"
-        bar_chart.width = 14
-        bar_chart.height = 10
-
-        data_ref = Reference(ws, min_col=3, min_row=9, max_row=12)
-        cats_ref = Reference(ws, min_col=2, min_row=10, max_row=12)
-        bar_chart.add_data(data_ref, titles_from_data=True)
-        bar_chart.set_categories(cats_ref)
-        ws.add_chart(bar_chart, "F5")
+        bar_chart = wb.add_chart({"type": "column"})
+        bar_chart.add_series(series)
+        bar_chart.set_title({"name": "감성별 기사 수"})
+        bar_chart.set_y_axis({"name": "건수"})
+        bar_chart.set_x_axis({"name": "감성"})
+        bar_chart.set_size(size)
+        ws.insert_chart("F5", bar_chart)
 
         # ─ 파이 차트 ─
-        pie_chart = PieChart()
-        pie_chart.title = "감성 비율"
-        pie_chart.width = 14
-        pie_chart.height = 10
-
-        pie_data = Reference(ws, min_col=3, min_row=9, max_row=12)
-        pie_labels = Reference(ws, min_col=2, min_row=10, max_row=12)
-        pie_chart.add_data(pie_data, titles_from_data=True)
-        pie_chart.set_categories(pie_labels)
-        ws.add_chart(pie_chart, "F22")
+        pie_chart = wb.add_chart({"type": "pie"})
+        pie_chart.add_series(series)
+        pie_chart.set_title({"name": "감성 비율"})
+        pie_chart.set_size(size)
+        ws.insert_chart("F22", pie_chart)
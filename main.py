@@ -1,6 +1,6 @@
 """
 main.py - 전체 파이프라인 진입점
-Selenium 기반 3대 뉴스 사이트 통합 크롤링 → 감성 분석 → 시각화 → 엑셀 저장
+httpx + Playwright 기반 3대 뉴스 사이트 통합 크롤링 → 감성 분석 → 시각화 → 엑셀 저장
 """
 
 from crawler import MultiSiteCrawler
@@ -51,13 +51,13 @@ def run_pipeline(keyword: str, pages_per_site: int = 3,
     # STEP 3: 대시보드 시각화
     print("\n[STEP 3] 📊 대시보드 생성 중...")
     viz = DashboardVisualizer(keyword=keyword)
-    viz.create_dashboard(df)
-    print("  ✅ output/dashboard.png 저장 완료")
+    img = viz.create_dashboard(df, stats)
+    print(f"  ✅ {img} 저장 완료")
 
     # STEP 4: 엑셀 저장
     print("\n[STEP 4] 📂 엑셀 저장 중...")
     exporter = DataExporter(keyword=keyword)
-    path = exporter.export(df)
+    path = exporter.export(df, stats)
     print(f"  ✅ {path} 저장 완료")
 
     print("\n" + "=" * 60)
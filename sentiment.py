@@ -4,6 +4,9 @@ sentiment.py - 한국어 감성 분석 모듈
 """
 
 import re
+from functools import lru_cache
+import ahocorasick
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
 
@@ -112,6 +115,30 @@ NEGATIVE_DICT: dict[str, float] = {
 
 # 부정어 - 의미를 반전시키는 단어
 NEGATION_WORDS = ["안", "못", "없", "아니", "부", "비", "불", "미"]
+# 부정어 전체를 한 번의 C 수준 탐색으로 찾기 위한 정규식 ("아니"는 두 글자이므로 문자 집합 대신 선택)
+NEGATION_RE = re.compile("|".join(map(re.escape, NEGATION_WORDS)))
+
+# 기본 사전을 합친 (단어, 점수) 튜플 - 인스턴스마다 다시 병합하지 않도록 모듈 로드 시 한 번만
+LEXICON_ITEMS: tuple = tuple({**POSITIVE_DICT, **NEGATIVE_DICT}.items())
+
+
+@lru_cache(maxsize=8)
+def _lexicon_tables(items: tuple) -> tuple:
+    """
+    (단어, 점수) 튜플로 오토마톤과 단어/기본 점수 배열을 만듭니다.
+    사전 내용이 같으면 캐시된 결과를 돌려주므로 분석기를 여러 번 만들어도 한 번만 빌드됩니다.
+    (사용자 사전이 계속 바뀌는 장기 실행 프로세스에서도 최근 8개 사전만 메모리에 유지)
+    """
+    automaton = ahocorasick.Automaton()
+    for order, (word, score) in enumerate(items):
+        automaton.add_word(word, (order, word, score))   # 값: (사전 순서, 단어, 점수)
+    automaton.make_automaton()
+
+    words = np.array([word for word, _ in items], dtype=object)
+    base  = np.fromiter((score for _, score in items), dtype=float, count=len(items))
+    words.setflags(write=False)
+    base.setflags(write=False)
+    return automaton, words, base
 
 
 @dataclass
@@ -127,7 +154,7 @@ class SentimentAnalyzer:
     한국어 뉴스 제목 감성 분석기
     
     알고리즘:
-      1. 사전의 각 단어가 제목에 포함되는지 확인
+      1. 사전 전체로 만든 Aho-Corasick 오토마톤으로 제목을 한 번 훑어 단어 탐색
       2. 부정어(안, 못, 없...) 앞에 있는 단어는 점수를 반전
       3. 최종 합산 점수로 긍정/부정/중립 분류
     
@@ -147,7 +174,13 @@ class SentimentAnalyzer:
     ):
         self.pos_dict = pos_dict or POSITIVE_DICT
         self.neg_dict = neg_dict or NEGATIVE_DICT
-        self.all_dict = {**self.pos_dict, **self.neg_dict}
+        if self.pos_dict is POSITIVE_DICT and self.neg_dict is NEGATIVE_DICT:
+            items = LEXICON_ITEMS
+        else:
+            items = tuple({**self.pos_dict, **self.neg_dict}.items())
+        # 오토마톤 + 배치 채점용 병렬 배열 (단어 / 기본 점수, 사전 순서 유지)
+        # 같은 사전이면 인스턴스끼리 공유 (읽기 전용으로만 사용)
+        self.automaton, self.words, self.base = _lexicon_tables(items)
 
     # ── 공개 API ─────────────────────────────────────────────────
     def analyze(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -160,44 +193,114 @@ class SentimentAnalyzer:
           - matched_pos : 매칭된 긍정 단어 목록
           - matched_neg : 매칭된 부정 단어 목록
         """
-        results = df["title"].apply(self._score_title)
+        titles = df["title"].to_numpy()
+
+        # 매칭을 평평한 병렬 배열(행 번호, 단어 번호, 부호)로 모음
+        rows, cols, signs = [], [], []
+        for i, title in enumerate(titles):
+            if isinstance(title, str):
+                for order, _, _, sign in self._signed_hits(title):
+                    rows.append(i)
+                    cols.append(order)
+                    signs.append(sign)
+
+        # 점수 합산과 단어 목록 분류는 배열 단위로 처리
+        rows    = np.asarray(rows, dtype=np.intp)
+        cols    = np.asarray(cols, dtype=np.intp)
+        contrib = np.asarray(signs, dtype=float) * self.base[cols]   # 단어별 실제 점수
+        scores  = np.bincount(rows, weights=contrib, minlength=len(titles)).astype(float)
+        scores  = np.round(scores, 2)
+        matched_pos = self._join_words(rows, cols, contrib > 0, len(titles))
+        matched_neg = self._join_words(rows, cols, contrib < 0, len(titles))
 
-        df = df.copy()
-        df["score"]       = results.apply(lambda r: r.score)
-        df["sentiment"]   = results.apply(lambda r: r.sentiment)
-        df["matched_pos"] = results.apply(lambda r: ", ".join(r.matched_pos))
-        df["matched_neg"] = results.apply(lambda r: ", ".join(r.matched_neg))
-        return df
+        # 레이블은 점수 배열 전체에 임계값을 한 번에 적용해 분류
+        sentiments = np.where(scores > self.POS_THRESHOLD, "긍정",
+                              np.where(scores < self.NEG_THRESHOLD, "부정", "중립"))
+
+        # assign은 새 DataFrame을 반환하므로 원본은 그대로 유지됨
+        return df.assign(
+            score=scores,
+            sentiment=sentiments.astype(object),
+            matched_pos=matched_pos,
+            matched_neg=matched_neg,
+        )
 
     def score_single(self, text: str) -> SentimentResult:
         """단일 텍스트의 감성 점수를 반환합니다."""
-        return self._score_title(text)
+        score, matched_pos, matched_neg = self._score_title(text)
+        return SentimentResult(
+            score=score,
+            sentiment=self._label(score),
+            matched_pos=matched_pos,
+            matched_neg=matched_neg,
+        )
 
     # ── 내부 로직 ────────────────────────────────────────────────
-    def _score_title(self, title: str) -> SentimentResult:
+    def _label(self, score: float) -> str:
+        """점수 하나를 긍정/부정/중립 레이블로 분류합니다."""
+        if score > self.POS_THRESHOLD:
+            return "긍정"
+        if score < self.NEG_THRESHOLD:
+            return "부정"
+        return "중립"
+
+    def _signed_hits(self, title: str) -> list:
         """
-        제목 하나의 감성 점수를 계산합니다.
+        제목에 포함된 사전 단어를 (사전 순서, 단어, 기본 점수, 부호) 목록으로 반환합니다.
+        단어별 첫 등장 위치 기준이며, 앞쪽 5글자 안에 부정어가 있으면 부호는 -1입니다.
+        """
+        # 한 번의 스캔으로 모든 (겹치는 것 포함) 매칭을 찾고, 단어별 첫 등장 위치만 사용
+        first_hit = {}
+        for end, (order, word, base_score) in self.automaton.iter(title):
+            if order not in first_hit:
+                first_hit[order] = (end - len(word) + 1, word, base_score)
+        if not first_hit:
+            return []
+
+        # 제목에 부정어가 아예 없으면 단어별 앞 5글자 확인을 생략
+        check_negation = NEGATION_RE.search(title) is not None
+
+        # 사전 순서대로 정렬해 매칭 단어 목록 순서를 유지
+        hits = []
+        for order in sorted(first_hit):
+            idx, word, base_score = first_hit[order]
+            negated = (check_negation and
+                       NEGATION_RE.search(title, max(0, idx - 5), idx) is not None)
+            hits.append((order, word, base_score, -1 if negated else 1))
+        return hits
+
+    def _join_words(self, rows: np.ndarray, cols: np.ndarray,
+                    mask: np.ndarray, n: int) -> list:
+        """mask로 고른 매칭을 행별로 묶어 ", "로 이은 문자열 목록(길이 n)을 만듭니다."""
+        joined = [""] * n
+        rows, words = rows[mask], self.words[cols[mask]].tolist()
+        # rows는 오름차순이므로 행이 바뀌는 경계로 잘라 묶음
+        row_ids, starts = np.unique(rows, return_index=True)
+        for i, lo, hi in zip(row_ids.tolist(), starts.tolist(),
+                             starts[1:].tolist() + [len(words)]):
+            joined[i] = ", ".join(words[lo:hi])
+        return joined
+
+    def _score_title(self, title: str) -> tuple:
+        """
+        제목 하나의 감성 점수를 계산합니다. (score_single용 단건 경로)
+        analyze는 같은 _signed_hits 결과를 배열로 모아 한 번에 합산합니다.
+
+        Returns:
+            (점수, 매칭 긍정 단어 목록, 매칭 부정 단어 목록)
         
         부정어 처리:
           '하락 없는' → '하락'이 부정어 뒤에 있으므로 점수 반전 (+1.5)
         """
         if not isinstance(title, str) or not title.strip():
-            return SentimentResult(score=0.0, sentiment="중립")
+            return 0.0, [], []
 
         total_score = 0.0
         matched_pos = []
         matched_neg = []
 
-        for word, base_score in self.all_dict.items():
-            if word not in title:
-                continue
-
-            # 해당 단어 위치 파악 후 앞쪽 5글자 내 부정어 여부 확인
-            idx = title.find(word)
-            context_before = title[max(0, idx - 5): idx]
-            has_negation = any(neg in context_before for neg in NEGATION_WORDS)
-
-            actual_score = -base_score if has_negation else base_score
+        for _, word, base_score, sign in self._signed_hits(title):
+            actual_score = sign * base_score
 
             if actual_score > 0:
                 matched_pos.append(word)
@@ -206,33 +309,30 @@ class SentimentAnalyzer:
 
             total_score += actual_score
 
-        # 감성 레이블 분류
-        if total_score > self.POS_THRESHOLD:
-            sentiment = "긍정"
-        elif total_score < self.NEG_THRESHOLD:
-            sentiment = "부정"
-        else:
-            sentiment = "중립"
-
-        return SentimentResult(
-            score=round(total_score, 2),
-            sentiment=sentiment,
-            matched_pos=matched_pos,
-            matched_neg=matched_neg,
-        )
+        return round(total_score, 2), matched_pos, matched_neg
 
     # ── 유틸리티 ─────────────────────────────────────────────────
-    def get_statistics(self, df: pd.DataFrame) -> dict:
-        """분석 결과 요약 통계를 반환합니다."""
-        counts = df["sentiment"].value_counts()
-        total = len(df)
+    @staticmethod
+    def get_statistics(df: pd.DataFrame) -> dict:
+        """
+        분석 결과 요약 통계를 반환합니다.
+        레이블 건수/비율은 한 번만 집계하며, 결과는 DashboardVisualizer.create_dashboard와
+        DataExporter.export에 그대로 넘길 수 있습니다.
+        (두 모듈도 stats를 받지 못하면 이 함수로 집계하므로 수치가 항상 같음)
+        """
+        total  = len(df)
+        vc     = df["sentiment"].value_counts(sort=False)
+        counts = vc.to_dict()
+        # 비율(%)도 같은 집계에서 한 번에 계산 (빈 DataFrame이면 빈 dict → 0)
+        ratios = vc.div(total).mul(100).round(1).to_dict() if total else {}
         return {
             "total":       total,
             "positive":    counts.get("긍정", 0),
             "negative":    counts.get("부정", 0),
             "neutral":     counts.get("중립", 0),
-            "pos_ratio":   round(counts.get("긍정", 0) / total * 100, 1),
-            "neg_ratio":   round(counts.get("부정", 0) / total * 100, 1),
+            "pos_ratio":   ratios.get("긍정", 0.0),
+            "neg_ratio":   ratios.get("부정", 0.0),
+            "neu_ratio":   ratios.get("중립", 0.0),
             "avg_score":   round(df["score"].mean(), 3),
             "max_score":   df["score"].max(),
             "min_score":   df["score"].min(),
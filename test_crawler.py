@@ -0,0 +1,86 @@
+"""
+test_crawler.py - 크롤러 회귀 테스트
+실행: python -m pytest -q
+"""
+
+import asyncio
+
+import httpx
+
+from crawler import DaumCrawler, HankyungCrawler, NaverCrawler, NewsItem, _deduplicate
+
+
+def test_field_selectors_fall_through_in_listed_order():
+    ts = "2024-01-01 00:00:00"
+    # 앞선 후보가 문서 순서상 뒤에 있어도 먼저 시도되어야 함
+    hk = ('<ul><li class="item"><span class="tit">속보</span>'
+          '<h3 class="title"><a href="https://h.example.com/1">삼성전자 실적 발표</a></h3></li></ul>')
+    assert [i.title for i in HankyungCrawler().parse_page(hk, ts)] == ["삼성전자 실적 발표"]
+
+    # 첫 후보가 비어 있으면 다음 후보로 넘어가야 함
+    daum = ('<ul><li class="g_item"><a class="tit_main" href="https://d.example.com/1"></a>'
+            '<a class="link_txt" href="https://d.example.com/1">삼성전자 신제품</a></li></ul>')
+    assert [i.title for i in DaumCrawler().parse_page(daum, ts)] == ["삼성전자 신제품"]
+
+    naver = ('<ul class="list_news"><li class="bx"><a class="press">기자</a>'
+             '<a class="news_tit" href="https://n.example.com/1">제목</a>'
+             '<a class="info press">연합뉴스</a></li></ul>')
+    assert [i.press for i in NaverCrawler().parse_page(naver, ts)] == ["연합뉴스"]
+
+
+def _item(title: str, url: str, source: str = "naver") -> NewsItem:
+    return NewsItem(title=title, press="언론사", pub_time="1시간 전", url=url,
+                    source=source, crawled_at="2024-01-01 00:00:00")
+
+
+def test_deduplicate_keeps_first_by_url_then_title():
+    items = [
+        _item("삼성전자 주가 급등", "https://n.example.com/1"),
+        _item("다른 제목", "https://n.example.com/1 ", source="daum"),   # 같은 URL (공백 차이)
+        _item("삼성전자 실적 발표", ""),
+        _item("삼성전자 실적 발표", "", source="hankyung"),              # URL 없음 → 제목 기준
+        _item("삼성전자 주가 급등", "https://n.example.com/2"),           # 제목만 같음 → 유지
+    ]
+    unique = _deduplicate(items)
+    assert [(i.title, i.source) for i in unique] == [
+        ("삼성전자 주가 급등", "naver"),
+        ("삼성전자 실적 발표", "naver"),
+        ("삼성전자 주가 급등", "naver"),
+    ]
+
+
+def test_crawl_returns_deduplicated_items_from_static_html():
+    card = ('<li class="bx"><a class="news_tit" href="https://n.example.com/{i}">제목 {i}</a>'
+            '<a class="info press">연합뉴스</a><span class="info">1시간 전</span></li>')
+    # 두 페이지가 같은 기사를 돌려줘도 한 번만 남아야 함
+    html = '<ul class="list_news">' + card.format(i=1) + card.format(i=2) + "</ul>"
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, text=html)))
+        try:
+            return await NaverCrawler(delay_range=(0, 0)).crawl("삼성전자", pages=2, http=http)
+        finally:
+            await http.aclose()
+
+    items = asyncio.run(run())
+    assert [i.url for i in items] == ["https://n.example.com/1", "https://n.example.com/2"]
+    assert all(i.source == "naver" and i.press == "연합뉴스" for i in items)
+
+
+def test_crawl_resets_adaptive_wait():
+    html = ('<ul class="list_news"><li class="bx"><a class="news_tit" href="https://n.example.com/1">'
+            '제목</a><a class="info press">연합뉴스</a></li></ul>')
+    crawler = NaverCrawler(wait_sec=8, delay_range=(0, 0))
+    crawler.wait_sec, crawler._session_timeouts = 20, 9   # 이전 키워드에서 늘어난 상태
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, text=html)))
+        try:
+            return await crawler.crawl("삼성전자", pages=1, http=http)
+        finally:
+            await http.aclose()
+
+    asyncio.run(run())
+    assert (crawler.wait_sec, crawler._session_timeouts) == (8, 0)
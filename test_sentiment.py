@@ -0,0 +1,96 @@
+"""
+test_sentiment.py - 감성 점수 산출 회귀 테스트
+실행: python -m pytest -q
+"""
+
+import numpy as np
+import pandas as pd
+
+from sentiment import NEGATION_WORDS, NEGATIVE_DICT, POSITIVE_DICT, SentimentAnalyzer
+
+
+def _reference_score(title, lexicon: dict) -> tuple:
+    """사전을 순서대로 돌며 str.find로 채점하던 원래 방식 (비교 기준)."""
+    if not isinstance(title, str) or not title.strip():
+        return 0.0, "", ""
+    total, pos, neg = 0.0, [], []
+    for word, base_score in lexicon.items():
+        idx = title.find(word)
+        if idx < 0:
+            continue
+        context_before = title[max(0, idx - 5): idx]
+        score = -base_score if any(n in context_before for n in NEGATION_WORDS) else base_score
+        if score > 0:
+            pos.append(word)
+        elif score < 0:
+            neg.append(word)
+        total += score
+    return round(total, 2), ", ".join(pos), ", ".join(neg)
+
+
+def _analyze(titles, analyzer=None) -> pd.DataFrame:
+    return (analyzer or SentimentAnalyzer()).analyze(pd.DataFrame({"title": titles}))
+
+
+def _rows(df: pd.DataFrame) -> list:
+    return list(zip(df["score"], df["matched_pos"], df["matched_neg"]))
+
+
+def test_repeated_word_counts_once():
+    df = _analyze(["급등 후 또 급등, 다시 급등"])
+    assert _rows(df) == [(3.0, "급등", "")]
+
+
+def test_negation_window_is_five_characters():
+    titles = [
+        "안 하락",          # 바로 앞 부정어 → 반전
+        "안xxxx하락",       # 5글자 창의 맨 앞
+        "안xxxxx하락",      # 창 밖 → 그대로
+        "아니xxx하락",      # 두 글자 부정어가 창 안에 온전히 있음
+        "아니xxxx하락",     # '니'만 창 안 → 부정어 아님
+        "하락 없는 실적",   # 부정어가 뒤에 있으면 반전하지 않음
+    ]
+    assert _rows(_analyze(titles)) == [
+        (1.5, "하락", ""),
+        (1.5, "하락", ""),
+        (-1.5, "", "하락"),
+        (1.5, "하락", ""),
+        (-1.5, "", "하락"),
+        (-1.5, "", "하락"),
+    ]
+
+
+def test_matched_words_follow_dictionary_order():
+    # 제목 순서가 아니라 사전 순서 (급등 → 상승, 흥행 → 흥행성공 → 성공)
+    df = _analyze(["상승 뒤 급등", "흥행성공"])
+    assert list(df["matched_pos"]) == ["급등, 상승", "흥행, 흥행성공, 성공"]
+
+
+def test_non_str_and_empty_titles_are_neutral():
+    df = _analyze([None, np.nan, "", "   ", 123])
+    assert _rows(df) == [(0.0, "", "")] * 5
+    assert list(df["sentiment"]) == ["중립"] * 5
+    assert SentimentAnalyzer().score_single(None).score == 0.0
+
+
+def test_custom_dictionary():
+    analyzer = SentimentAnalyzer(pos_dict={"좋음": 2.0}, neg_dict={"나쁨": -1.0})
+    df = _analyze(["좋음 그리고 나쁨", "급등"], analyzer)
+    assert _rows(df) == [(1.0, "좋음", "나쁨"), (0.0, "", "")]
+    assert list(df["sentiment"]) == ["긍정", "중립"]
+
+
+def test_analyze_and_score_single_match_reference():
+    lexicon = {**POSITIVE_DICT, **NEGATIVE_DICT}
+    titles = [
+        "삼성전자 주가 급등, 신고가 돌파", "실적 부진 우려에 하락", "적자 없는 흑자 전환",
+        "반도체 불황 속 수주 성공", "리콜 논란 못 피해 급락", "합의 결렬로 갈등 확대",
+        "과징금 부과 안 해 반등", "흥행성공 기대", "평범한 제목", "",
+    ]
+    analyzer = SentimentAnalyzer()
+    expected = [_reference_score(t, lexicon) for t in titles]
+    assert _rows(_analyze(titles, analyzer)) == expected
+    for title, (score, pos, neg) in zip(titles, expected):
+        result = analyzer.score_single(title)
+        assert (result.score, ", ".join(result.matched_pos), ", ".join(result.matched_neg)) \
+            == (score, pos, neg)
@@ -8,16 +8,22 @@ import warnings
 import numpy as np
 import pandas as pd
 import matplotlib
+matplotlib.use("Agg")   # 파일 저장 전용 백엔드 (GUI 없이 렌더링)
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
 import seaborn as sns
-from collections import Counter
+
+from sentiment import SentimentAnalyzer
 
 warnings.filterwarnings("ignore")
 
 # ── 한글 폰트 자동 설정 ───────────────────────────────────────────────────────
-def _set_korean_font():
-    """OS별로 사용 가능한 한글 폰트를 자동으로 설정합니다."""
+# 한 번 찾은 폰트 이름은 모듈 변수에 남겨 다시 호출해도 폰트 목록을 훑지 않음
+_KOREAN_FONT = None
+
+
+def _find_korean_font():
+    """OS별 한글 폰트 후보 중 설치된 첫 번째 폰트를 찾습니다."""
     font_candidates = [
         # macOS
         "AppleGothic", "Apple SD Gothic Neo",
@@ -32,13 +38,26 @@ def _set_korean_font():
     available = {f.name for f in fm.fontManager.ttflist}
     for font in font_candidates:
         if font in available:
-            matplotlib.rc("font", family=font)
-            matplotlib.rcParams["axes.unicode_minus"] = False
             return font
+    return None
 
-    # 폴백: 기본 폰트 사용 (한글이 깨질 수 있음)
+
+def _set_korean_font():
+    """OS별로 사용 가능한 한글 폰트를 자동으로 설정합니다."""
+    global _KOREAN_FONT
     matplotlib.rcParams["axes.unicode_minus"] = False
-    return None
+
+    # 사용자가 이미 폰트를 지정했으면 그대로 둠
+    if matplotlib.rcParams["font.family"] != ["sans-serif"]:
+        return _KOREAN_FONT
+
+    if _KOREAN_FONT is None:
+        _KOREAN_FONT = _find_korean_font()
+
+    # 폴백: 찾지 못하면 기본 폰트 사용 (한글이 깨질 수 있음)
+    if _KOREAN_FONT:
+        matplotlib.rc("font", family=_KOREAN_FONT)
+    return _KOREAN_FONT
 
 _set_korean_font()
 
@@ -73,9 +92,12 @@ class DashboardVisualizer:
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
 
-    def create_dashboard(self, df: pd.DataFrame) -> str:
+    def create_dashboard(self, df: pd.DataFrame, stats: dict = None) -> str:
         """
         전체 대시보드를 생성하고 파일로 저장합니다.
+
+        Args:
+            stats: SentimentAnalyzer.get_statistics() 결과 (None이면 여기서 같은 함수로 집계)
         
         Returns:
             저장된 파일 경로
@@ -104,7 +126,7 @@ class DashboardVisualizer:
         self._plot_keyword_freq(ax_kw, df)
 
         # 하단 통계 요약 텍스트
-        self._add_summary_text(fig, df)
+        self._add_summary_text(fig, df, stats)
 
         output_path = os.path.join(self.output_dir, "dashboard.png")
         plt.savefig(output_path, dpi=150, bbox_inches="tight",
@@ -172,10 +194,12 @@ class DashboardVisualizer:
 
     # ── 패널 3: 감성 점수 분포 히스토그램 ───────────────────────
     def _plot_histogram(self, ax, df: pd.DataFrame):
-        # 감성별로 색 구분하여 stacked 히스토그램
+        # 감성별로 색 구분하여 stacked 히스토그램 (groupby 한 번으로 감성별 점수 배열 분리)
+        grouped = {k: g.to_numpy()
+                   for k, g in df["score"].groupby(df["sentiment"], observed=True, sort=False)}
         for sentiment, color in zip(SENTIMENT_ORDER, PALETTE):
-            subset = df[df["sentiment"] == sentiment]["score"]
-            if subset.empty:
+            subset = grouped.get(sentiment)
+            if subset is None or subset.size == 0:
                 continue
             ax.hist(
                 subset, bins=15, color=color, alpha=0.75,
@@ -203,19 +227,9 @@ class DashboardVisualizer:
 
     # ── 패널 4: 키워드 빈도 차트 ─────────────────────────────────
     def _plot_keyword_freq(self, ax, df: pd.DataFrame):
-        # 감성 사전의 매칭 단어를 집계
-        pos_words = []
-        neg_words = []
-
-        for _, row in df.iterrows():
-            if pd.notna(row.get("matched_pos")) and row["matched_pos"]:
-                pos_words.extend(row["matched_pos"].split(", "))
-            if pd.notna(row.get("matched_neg")) and row["matched_neg"]:
-                neg_words.extend(row["matched_neg"].split(", "))
-
-        # 상위 10개씩 추출
-        top_pos = Counter(pos_words).most_common(10)
-        top_neg = Counter(neg_words).most_common(10)
+        # 감성 사전의 매칭 단어를 집계 → 상위 10개씩 추출
+        top_pos = self._top_words(df, "matched_pos")
+        top_neg = self._top_words(df, "matched_neg")
         top_neg_inv = [(w, -c) for w, c in top_neg]  # 음수 방향으로 표시
 
         all_words = [w for w, _ in top_neg_inv[::-1]] + [w for w, _ in top_pos]
@@ -256,18 +270,25 @@ class DashboardVisualizer:
         for spine in ax.spines.values():
             spine.set_edgecolor("#444")
 
+    @staticmethod
+    def _top_words(df: pd.DataFrame, column: str, n: int = 10) -> list:
+        """쉼표로 이어 붙인 매칭 단어 컬럼을 펼쳐 (단어, 빈도) 상위 n개를 반환합니다."""
+        if column not in df.columns:
+            return []
+        words = df[column].dropna()
+        words = words[words != ""].str.split(", ").explode()
+        return list(words.value_counts().head(n).items())
+
     # ── 하단 요약 텍스트 ──────────────────────────────────────────
-    def _add_summary_text(self, fig, df: pd.DataFrame):
-        total = len(df)
-        counts = df["sentiment"].value_counts()
-        pos_r = counts.get("긍정", 0) / total * 100
-        neg_r = counts.get("부정", 0) / total * 100
-        avg   = df["score"].mean()
+    def _add_summary_text(self, fig, df: pd.DataFrame, stats: dict = None):
+        # 엑셀 요약 시트와 같은 집계를 사용 (stats가 없을 때도 같은 함수로 계산)
+        if stats is None:
+            stats = SentimentAnalyzer.get_statistics(df)
 
         summary = (
-            f"총 분석 기사: {total}건  |  "
-            f"긍정 {pos_r:.1f}%  |  부정 {neg_r:.1f}%  |  "
-            f"평균 감성 점수: {avg:+.2f}"
+            f"총 분석 기사: {stats['total']}건  |  "
+            f"긍정 {stats['pos_ratio']:.1f}%  |  부정 {stats['neg_ratio']:.1f}%  |  "
+            f"평균 감성 점수: {stats['avg_score']:+.2f}"
         )
         fig.text(
             0.5, 0.01, summary,